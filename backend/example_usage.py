@@ -3,40 +3,48 @@ Example usage of the relevance filter for generating LLM prompts.
 """
 
 from relevance_filter import generate_llm_prompt_from_file, generate_llm_prompt
-import json
+from pathlib import Path
+import io
+import sys
+
+import orjson
 
 # Example 1: Generate prompt from JSON file
 if __name__ == "__main__":
-    print("=" * 80)
-    print("Example: Generating LLM prompt from mock_data.json")
-    print("=" * 80)
-    print()
+    # Collect all output and write it to stdout once at the end
+    buf = io.StringIO()
+    
+    print("=" * 80, file=buf)
+    print("Example: Generating LLM prompt from mock_data.json", file=buf)
+    print("=" * 80, file=buf)
+    print(file=buf)
     
     prompt = generate_llm_prompt_from_file('mock_data.json')
-    print(prompt)
+    print(prompt, file=buf)
     
-    print()
-    print("=" * 80)
-    print("Example: Generating prompt with custom tone")
-    print("=" * 80)
-    print()
+    print(file=buf)
+    print("=" * 80, file=buf)
+    print("Example: Generating prompt with custom tone", file=buf)
+    print("=" * 80, file=buf)
+    print(file=buf)
     
     # Example 2: Generate prompt with custom tone
     prompt_custom = generate_llm_prompt_from_file(
         'mock_data.json', 
         tone="excited, highlight-reel style"
     )
-    print(prompt_custom)
+    print(prompt_custom, file=buf)
     
-    print()
-    print("=" * 80)
-    print("Example: Using with in-memory data")
-    print("=" * 80)
-    print()
+    print(file=buf)
+    print("=" * 80, file=buf)
+    print("Example: Using with in-memory data", file=buf)
+    print("=" * 80, file=buf)
+    print(file=buf)
     
     # Example 3: Using with in-memory data
-    with open('mock_data.json', 'r') as f:
-        game_data = json.load(f)
+    game_data = orjson.loads(Path('mock_data.json').read_bytes())
     
     prompt_memory = generate_llm_prompt(game_data, tone="analytical, data-driven")
-    print(prompt_memory)
+    print(prompt_memory, file=buf)
+    
+    sys.stdout.write(buf.getvalue())
@@ -1,15 +1,29 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional, Dict, Any, Tuple
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
+from typing import List, Optional, Dict, Any, Tuple, TypedDict
 from datetime import datetime
-from pydantic import BaseModel
-import json
+from functools import lru_cache
+from operator import itemgetter
+from pydantic import BaseModel, TypeAdapter
+import aiofiles
+import aiofiles.os
+import asyncio
+import hashlib
+import httpx
+import orjson
+import os
+import threading
 import time
+import uuid
 from pathlib import Path
 from math import ceil
-from nba_api.live.nba.endpoints import scoreboard, boxscore
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-from relevance_filter import generate_llm_prompt
+from relevance_filter import generate_llm_prompt, generate_batch_llm_prompt, parse_batch_llm_response
 from llm_service import (
     load_cached_summary,
     save_cached_summary,
@@ -17,7 +31,39 @@ from llm_service import (
     validate_api_key,
 )
 
-app = FastAPI(title="NBA Game Recaps API")
+# NBA live-data CDN (the feeds behind nba_api's live ScoreBoard/BoxScore endpoints)
+NBA_LIVE_DATA_URL = "https://cdn.nba.com/static/json/liveData"
+NBA_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Origin": "https://www.nba.com",
+    "Referer": "https://www.nba.com/",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.88 Safari/537.36",
+}
+_HTTPX = httpx.AsyncClient(timeout=10, http2=True, headers=NBA_HEADERS)
+
+
+async def _fetch_scoreboard_remote() -> bytes:
+    """Fetches today's raw scoreboard JSON from the NBA CDN."""
+    response = await _HTTPX.get(f"{NBA_LIVE_DATA_URL}/scoreboard/todaysScoreboard_00.json")
+    response.raise_for_status()
+    return response.content
+
+
+async def _fetch_boxscore_remote(game_id: str) -> bytes:
+    """Fetches a game's raw boxscore JSON from the NBA CDN."""
+    response = await _HTTPX.get(f"{NBA_LIVE_DATA_URL}/boxscore/boxscore_{game_id}.json")
+    response.raise_for_status()
+    return response.content
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await _HTTPX.aclose()
+
+
+app = FastAPI(title="NBA Game Recaps API", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Configure CORS
 app.add_middleware(
@@ -28,7 +74,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Pydantic models for request/response
+# Compress JSON responses for clients that send Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Pydantic models for request/response.
+# Instances built from NBA/cache data use model_construct, which skips validation of values we produced.
 class Game(BaseModel):
     id: str
     awayTeam: str
@@ -40,6 +90,18 @@ class Game(BaseModel):
     date: str
     status: str  # "scheduled", "in_progress", "finished"
 
+class GameDict(TypedDict):
+    """Plain-dict shape of Game, used on the scoreboard path and serialized directly with orjson."""
+    id: str
+    awayTeam: str
+    homeTeam: str
+    awayTeamId: Optional[int]
+    homeTeamId: Optional[int]
+    awayScore: Optional[int]
+    homeScore: Optional[int]
+    date: str
+    status: str
+
 class GameSummary(BaseModel):
     gameId: str
     summary: str
@@ -49,214 +111,397 @@ class GameSummary(BaseModel):
     awayTeam: Optional[str] = None
     homeTeam: Optional[str] = None
 
+# Built once so responses go straight through pydantic's serializer instead of jsonable_encoder
+_SUMMARY_ADAPTER = TypeAdapter(GameSummary)
+
+
+def _json_response(adapter: TypeAdapter, value: Any) -> Response:
+    """Serialize value with a prebuilt TypeAdapter and wrap the bytes in a JSON Response."""
+    return Response(content=adapter.dump_json(value), media_type="application/json")
+
 # Cache directory
 CACHE_DIR = Path(__file__).parent / "cache"
 CACHE_DIR.mkdir(exist_ok=True)
 
 REFRESH_COOLDOWN_SECONDS = 30 * 60  # 30 minutes
+SCOREBOARD_CACHE_FILE = CACHE_DIR / "scoreboard_today.json"
 SCOREBOARD_REFRESHED_AT_FILE = CACHE_DIR / "scoreboard_today_refreshed_at.txt"
 
+# In-memory LRU of parsed cache files so hot requests skip disk reads and JSON parsing.
+# Entries are trusted for the TTL, then re-validated against the file's mtime.
+SCOREBOARD_MEM_TTL_SECONDS = 5  # live scores
+BOXSCORE_MEM_TTL_SECONDS = 10 * 60  # 10 minutes
+MEM_CACHE_MAX_ENTRIES = 256
+_MEM_CACHE: "OrderedDict[Path, Tuple[float, Optional[int], Any]]" = OrderedDict()  # path -> (checked_at, mtime_ns, data)
+# Sync routes touch the cache from the threadpool while async handlers use it on the loop
+_MEM_CACHE_LOCK = threading.Lock()
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Returns the file's mtime in nanoseconds, or None if it can't be stat'ed."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _mem_cache_get(path: Path, ttl: float) -> Any:
+    """Returns the in-memory copy of a cache file, or None if missing or the file changed since it was stored."""
+    with _MEM_CACHE_LOCK:
+        entry = _MEM_CACHE.get(path)
+        if entry is None:
+            return None
+        checked_at, mtime_ns, data = entry
+        now = time.monotonic()
+        if now - checked_at >= ttl:
+            if mtime_ns is None or _mtime_ns(path) != mtime_ns:
+                _MEM_CACHE.pop(path, None)
+                return None
+            _MEM_CACHE[path] = (now, mtime_ns, data)
+        _MEM_CACHE.move_to_end(path)
+        return data
+
+
+def _mem_cache_put(path: Path, data: Any, mtime_ns: Optional[int]) -> Any:
+    """Stores parsed data for a cache file in memory, evicting the least recently used entries, and returns it.
+    mtime_ns must be the mtime of the exact file version data came from (None if unknown), taken before or
+    while reading it; stat'ing afterwards could pair old data with a newer writer's mtime."""
+    with _MEM_CACHE_LOCK:
+        _MEM_CACHE[path] = (time.monotonic(), mtime_ns, data)
+        _MEM_CACHE.move_to_end(path)
+        while len(_MEM_CACHE) > MEM_CACHE_MAX_ENTRIES:
+            _MEM_CACHE.popitem(last=False)
+    return data
+
+
+def _read_json(path: Path) -> Any:
+    """Reads and parses a JSON cache file with orjson."""
+    return orjson.loads(path.read_bytes())
+
+
+def _read_json_with_mtime(path: Path) -> Tuple[Any, int]:
+    """Reads and parses a JSON cache file, returning the mtime of the same open file it was read from."""
+    with open(path, 'rb') as f:
+        mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+        return orjson.loads(f.read()), mtime_ns
+
+
+def _read_json_cached(path: Path) -> Any:
+    """Like _read_json, but reuses the in-memory copy while the file's mtime is unchanged."""
+    data = _mem_cache_get(path, 0)
+    if data is None:
+        data = _mem_cache_put(path, *_read_json_with_mtime(path))
+    return data
+
+
+def _tmp_sibling(path: Path) -> Path:
+    """Returns a temp path next to path that is unique per writer, so concurrent writers never share one."""
+    return path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> int:
+    """Writes bytes to a temp sibling and swaps it in with os.replace, so readers never see a partial file.
+    Returns the written file's mtime (os.replace keeps it), for pairing with the in-memory copy."""
+    tmp = _tmp_sibling(path)
+    try:
+        tmp.write_bytes(data)
+        mtime_ns = tmp.stat().st_mtime_ns
+        os.replace(tmp, path)
+        return mtime_ns
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+async def _atomic_write_bytes_async(path: Path, data: bytes) -> int:
+    """Async (aiofiles) version of _atomic_write_bytes for use inside request handlers."""
+    tmp = _tmp_sibling(path)
+    try:
+        async with aiofiles.open(tmp, 'wb') as f:
+            await f.write(data)
+        mtime_ns = (await aiofiles.os.stat(tmp)).st_mtime_ns
+        await aiofiles.os.replace(tmp, path)
+        return mtime_ns
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 # Helper functions for caching and data transformation
-def fetch_scoreboard_data() -> Dict[str, Any]:
+async def _fetch_and_cache_scoreboard() -> Dict[str, Any]:
+    """Fetches the scoreboard from the NBA CDN, saves the upstream bytes as today's cache and returns the parsed data."""
+    raw = await _fetch_scoreboard_remote()
+    data = orjson.loads(raw)
+    mtime_ns = None  # unknown if the write fails, so the copy is only trusted for the TTL
+    try:
+        mtime_ns = await _atomic_write_bytes_async(SCOREBOARD_CACHE_FILE, raw)
+    except IOError as e:
+        print(f"Error writing cache file: {e}")
+    return _mem_cache_put(SCOREBOARD_CACHE_FILE, data, mtime_ns)
+
+
+async def fetch_scoreboard_data() -> Dict[str, Any]:
     """Fetches today's scoreboard data with caching. Use GET /games/today/refresh to overwrite cache."""
-    cache_file = CACHE_DIR / "scoreboard_today.json"
+    cache_file = SCOREBOARD_CACHE_FILE
     today = datetime.now().strftime("%Y-%m-%d")
 
-    if cache_file.exists():
+    # Whatever we parsed here is kept as a stale fallback if the API call fails
+    cached = _mem_cache_get(cache_file, SCOREBOARD_MEM_TTL_SECONDS)
+    if cached is not None and cached.get("scoreboard", {}).get("gameDate") == today:
+        return cached
+
+    if cached is None and cache_file.exists():
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-            cached_date = data.get("scoreboard", {}).get("gameDate")
+            async with aiofiles.open(cache_file, 'rb') as f:
+                mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+                cached = orjson.loads(await f.read())
+            cached_date = cached.get("scoreboard", {}).get("gameDate")
             if cached_date == today:
-                return data
-        except (json.JSONDecodeError, IOError) as e:
+                return _mem_cache_put(cache_file, cached, mtime_ns)
+        except (orjson.JSONDecodeError, IOError) as e:
             print(f"Error reading cache file: {e}")
 
     # Fetch from API (cache miss or wrong date)
     try:
-        scoreboard_obj = scoreboard.ScoreBoard()
-        data = scoreboard_obj.get_dict()
-        
-        # Save to cache
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except IOError as e:
-            print(f"Error writing cache file: {e}")
-        
-        return data
+        return await _fetch_and_cache_scoreboard()
     except Exception as e:
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                pass
+        if cached is not None:
+            return cached
         raise HTTPException(status_code=500, detail=f"Failed to fetch scoreboard data: {str(e)}")
 
 
 SUMMARY_CACHE_DIR = CACHE_DIR / "summaries"
 
-def _game_from_boxscore_data(data: Dict[str, Any]) -> Optional[Tuple[datetime, Game]]:
-    """Build a Game from boxscore dict; returns None if missing required fields."""
-    status_map = {1: "scheduled", 2: "in_progress", 3: "finished"}
+# API gameStatus -> (status, scores valid?); scores are only meaningful once a game has started
+_STATUS = {1: ("scheduled", False), 2: ("in_progress", True), 3: ("finished", True)}
+_STATUS_UNKNOWN = ("scheduled", False)
+
+
+@lru_cache(maxsize=32)
+def _fmt_game_date(raw: str) -> str:
+    """Formats a YYYY-MM-DD date as "Month DD, YYYY"; returns the input unchanged if it doesn't parse."""
+    try:
+        return datetime.fromisoformat(raw).strftime("%B %d, %Y")
+    except (TypeError, ValueError):
+        return raw
+
+
+# Skips validation: boxscore files were written from the NBA feed we trust
+_mk_game = Game.model_construct
+
+
+def _game_from_boxscore_data(data: Dict[str, Any]) -> Optional[Tuple[str, Game]]:
+    """Build (YYYY-MM-DD sort key, Game) from boxscore dict; returns None if missing required fields."""
     g = data.get("game") or {}
-    game_id = g.get("gameId")
+    g_get = g.get
+    game_id = g_get("gameId")
     if not game_id:
         return None
-    ht = g.get("homeTeam") or {}
-    at = g.get("awayTeam") or {}
-    game_status = g.get("gameStatus", 3)
-    status = status_map.get(game_status, "finished")
-    game_time = g.get("gameTimeLocal") or g.get("gameEt") or ""
+    ht_get = (g_get("homeTeam") or {}).get
+    at_get = (g_get("awayTeam") or {}).get
+    game_status = g_get("gameStatus", 3)
+    # Unknown statuses read as finished, the same as a missing one
+    status = _STATUS.get(game_status, _STATUS[3])[0]
+    game_time = g_get("gameTimeLocal") or g_get("gameEt") or ""
     date_str = game_time[:10] if len(game_time) >= 10 else ""
-    try:
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d") if date_str else datetime.min
-        formatted_date = date_obj.strftime("%B %d, %Y")
-    except Exception:
-        formatted_date = date_str or ""
-        date_obj = datetime.min
     return (
-        date_obj,
-        Game(
+        # ISO dates sort chronologically as plain strings
+        date_str or "0000-00-00",
+        _mk_game(
             id=game_id,
-            awayTeam=at.get("teamName", ""),
-            homeTeam=ht.get("teamName", ""),
-            awayTeamId=at.get("teamId"),
-            homeTeamId=ht.get("teamId"),
-            awayScore=at.get("score"),
-            homeScore=ht.get("score"),
-            date=formatted_date,
+            awayTeam=at_get("teamName", ""),
+            homeTeam=ht_get("teamName", ""),
+            awayTeamId=at_get("teamId"),
+            homeTeamId=ht_get("teamId"),
+            awayScore=at_get("score"),
+            homeScore=ht_get("score"),
+            date=_fmt_game_date(date_str),
             status=status,
         ),
     )
 
 
-def games_from_boxscore_cache() -> List[Game]:
-    """Build list of games from cached boxscore_*.json files (latest first). Uses only nba-api cache."""
-    entries: List[tuple] = []
-    for path in CACHE_DIR.glob("boxscore_*.json"):
+# Persisted index of game id -> {"sortKey", "game"} built from boxscore files,
+# so game lists don't have to open and parse every boxscore on each request
+INDEX_FILE = CACHE_DIR / "index.json"
+INDEX_REBUILD_WORKERS = 8
+_SORT_KEY = itemgetter("sortKey")
+# Serializes index read-modify-write cycles so concurrent upserts don't drop entries
+# (reentrant: an upsert may fall through to _rebuild_index)
+_INDEX_LOCK = threading.RLock()
+
+
+def _index_entry(data: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Build (game_id, index entry) from boxscore dict; returns None if missing required fields."""
+    entry = _game_from_boxscore_data(data)
+    if not entry:
+        return None
+    sort_key, game = entry
+    return game.id, {"sortKey": sort_key, "game": game.model_dump()}
+
+
+def _save_index(index: Dict[str, Dict[str, Any]]) -> None:
+    """Atomically writes the index file and keeps the in-memory copy in sync. Call with _INDEX_LOCK held."""
+    _mem_cache_put(INDEX_FILE, index, _atomic_write_bytes(INDEX_FILE, orjson.dumps(index)))
+
+
+def _load_orjson(path: Path) -> Optional[Any]:
+    """Reads and parses a JSON file; returns None if it can't be read or parsed."""
+    try:
+        return _read_json(path)
+    except (orjson.JSONDecodeError, OSError):
+        return None
+
+
+def _rebuild_index() -> Dict[str, Dict[str, Any]]:
+    """Rebuilds the index from all cached boxscore_*.json files (first run, or a corrupt index).
+    Files are read on a thread pool since the work is dominated by file I/O."""
+    with _INDEX_LOCK:
+        # Another thread may have rebuilt it while we waited for the lock
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            continue
-        entry = _game_from_boxscore_data(data)
-        if entry:
-            entries.append(entry)
-    entries.sort(key=lambda x: x[0], reverse=True)
-    return [game for _, game in entries]
+            return _read_json_cached(INDEX_FILE)
+        except (orjson.JSONDecodeError, OSError):
+            pass
+        index: Dict[str, Dict[str, Any]] = {}
+        paths = list(CACHE_DIR.glob("boxscore_*.json"))
+        with ThreadPoolExecutor(max_workers=INDEX_REBUILD_WORKERS) as executor:
+            datas = list(executor.map(_load_orjson, paths))
+        for data in datas:
+            item = _index_entry(data) if data is not None else None
+            if item:
+                index[item[0]] = item[1]
+        _save_index(index)
+        return index
+
+
+def _load_index() -> Dict[str, Dict[str, Any]]:
+    """Loads the game index, rebuilding it if it is missing or unreadable. Treat the result as read-only."""
+    try:
+        return _read_json_cached(INDEX_FILE)
+    except (orjson.JSONDecodeError, OSError):
+        return _rebuild_index()
 
 
-def games_with_cached_summaries() -> List[Game]:
-    """Build list of games that have a cached summary (summary_*.json). Uses boxscore cache for details."""
-    entries: List[tuple] = []
+def _upsert_index(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Adds or replaces the index entry for a boxscore dict; returns the entry."""
+    item = _index_entry(data)
+    if not item:
+        return None
+    game_id, entry = item
+    with _INDEX_LOCK:
+        index = dict(_load_index())
+        index[game_id] = entry
+        _save_index(index)
+    return entry
+
+
+def games_from_boxscore_cache() -> List[Game]:
+    """Build list of games from cached boxscores (latest first), via the index. Uses only the boxscore cache."""
+    entries = sorted(_load_index().values(), key=_SORT_KEY, reverse=True)
+    return [Game.model_construct(**entry["game"]) for entry in entries]
+
+
+def games_with_cached_summaries() -> List[GameDict]:
+    """Build list of games that have a cached summary (summary_*.json). Uses the boxscore index for details.
+    Returns the index's plain Game-shaped dicts; no models are built for the list view."""
+    entries: List[Dict[str, Any]] = []
     SUMMARY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    index = _load_index()
     for path in SUMMARY_CACHE_DIR.glob("summary_*.json"):
         game_id = path.stem.replace("summary_", "", 1)
         if not game_id:
             continue
-        boxscore_path = CACHE_DIR / f"boxscore_{game_id}.json"
-        if not boxscore_path.exists():
-            continue
-        try:
-            with open(boxscore_path, "r") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            continue
-        entry = _game_from_boxscore_data(data)
-        if entry:
-            entries.append(entry)
-    entries.sort(key=lambda x: x[0], reverse=True)
-    return [game for _, game in entries]
-
-
-def fetch_boxscore_data(game_id: str) -> Dict[str, Any]:
+        entry = index.get(game_id)
+        if entry is None:
+            # Boxscore cached by another worker (or before the index existed): index it now
+            boxscore_path = CACHE_DIR / f"boxscore_{game_id}.json"
+            if not boxscore_path.exists():
+                continue
+            try:
+                entry = _upsert_index(_read_json_cached(boxscore_path))
+            except (orjson.JSONDecodeError, OSError):
+                continue
+            if entry is None:
+                continue
+            index = _load_index()
+        entries.append(entry)
+    entries.sort(key=_SORT_KEY, reverse=True)
+    return [entry["game"] for entry in entries]
+
+
+async def fetch_boxscore_data(game_id: str) -> Dict[str, Any]:
     """Fetches boxscore data for a specific game with caching"""
     cache_file = CACHE_DIR / f"boxscore_{game_id}.json"
+    cached = _mem_cache_get(cache_file, BOXSCORE_MEM_TTL_SECONDS)
+    if cached is not None:
+        return cached
     
     # Check if cached data exists
     if cache_file.exists():
         try:
-            with open(cache_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            async with aiofiles.open(cache_file, 'rb') as f:
+                mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+                return _mem_cache_put(cache_file, orjson.loads(await f.read()), mtime_ns)
+        except (orjson.JSONDecodeError, IOError) as e:
             print(f"Error reading cache file: {e}")
     
     # Fetch from API
     try:
-        boxscore_obj = boxscore.BoxScore(game_id)
-        data = boxscore_obj.get_dict()
+        raw = await _fetch_boxscore_remote(game_id)
+        data = orjson.loads(raw)
         
-        # Save to cache
+        # Save the upstream bytes as-is
+        mtime_ns = None
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            mtime_ns = await _atomic_write_bytes_async(cache_file, raw)
+            # May rebuild the whole index on a fresh cache; keep that off the event loop
+            await asyncio.to_thread(_upsert_index, data)
         except IOError as e:
             print(f"Error writing cache file: {e}")
         
-        return data
+        return _mem_cache_put(cache_file, data, mtime_ns)
     except Exception as e:
-        # If API call fails and we have cached data, try to use it
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
+        # A readable cache file was returned above, so there is nothing to fall back to
         raise HTTPException(status_code=500, detail=f"Failed to fetch boxscore data for game {game_id}: {str(e)}")
 
-def transform_scoreboard_to_games(scoreboard_data: Dict[str, Any]) -> List[Game]:
-    """Transforms NBA API scoreboard response to Game models"""
-    games = []
+def transform_scoreboard_to_games(scoreboard_data: Dict[str, Any]) -> List[GameDict]:
+    """Transforms NBA API scoreboard response to Game-shaped dicts"""
+    games: List[GameDict] = []
     
     if "scoreboard" not in scoreboard_data or "games" not in scoreboard_data["scoreboard"]:
         return games
     
-    game_date = scoreboard_data["scoreboard"].get("gameDate", "")
-    # Format date from YYYY-MM-DD to "Month DD, YYYY"
-    try:
-        date_obj = datetime.strptime(game_date, "%Y-%m-%d")
-        formatted_date = date_obj.strftime("%B %d, %Y")
-    except:
-        formatted_date = game_date
+    formatted_date = _fmt_game_date(scoreboard_data["scoreboard"].get("gameDate", ""))
+    
+    # Bind per-iteration lookups to locals once, outside the loop
+    get_status = _STATUS.get
+    unknown = _STATUS_UNKNOWN
+    append = games.append
+    mk = GameDict
     
     for game_data in scoreboard_data["scoreboard"]["games"]:
-        game_id = game_data.get("gameId", "")
-        game_status = game_data.get("gameStatus", 1)
-        
-        # Map gameStatus: 1 = scheduled, 2 = in progress, 3 = finished
-        status_map = {
-            1: "scheduled",
-            2: "in_progress",
-            3: "finished"
-        }
-        status = status_map.get(game_status, "scheduled")
-        
-        home_team = game_data.get("homeTeam", {})
-        away_team = game_data.get("awayTeam", {})
-        
-        home_team_name = home_team.get("teamName", "")
-        away_team_name = away_team.get("teamName", "")
-        home_team_id = home_team.get("teamId")
-        away_team_id = away_team.get("teamId")
+        # Required keys are indexed directly so a malformed payload fails fast
+        ht = game_data["homeTeam"]
+        at = game_data["awayTeam"]
+        game_id = game_data["gameId"]
+        game_status = game_data["gameStatus"]
         
-        # Get scores (may be 0 for scheduled games)
-        home_score = home_team.get("score", 0)
-        away_score = away_team.get("score", 0)
+        status, scores_valid = get_status(game_status, unknown)
         
-        # For scheduled games, set scores to None
         # For finished/in_progress games, use the actual scores
-        if status == "scheduled":
-            home_score = None
-            away_score = None
+        # For scheduled games, set scores to None
+        if scores_valid:
+            home_score = ht.get("score", 0)
+            away_score = at.get("score", 0)
+        else:
+            home_score = away_score = None
         
-        games.append(Game(
+        append(mk(
             id=game_id,
-            awayTeam=away_team_name,
-            homeTeam=home_team_name,
-            awayTeamId=away_team_id,
-            homeTeamId=home_team_id,
+            awayTeam=at["teamName"],
+            homeTeam=ht["teamName"],
+            awayTeamId=at["teamId"],
+            homeTeamId=ht["teamId"],
             awayScore=away_score,
             homeScore=home_score,
             date=formatted_date,
@@ -265,12 +510,18 @@ def transform_scoreboard_to_games(scoreboard_data: Dict[str, Any]) -> List[Game]
     
     return games
 
-# Mock data for today's games
+# Mock data for today's games, built once per calendar day
+_TODAY_CACHE: Tuple[Optional[str], List[Game]] = (None, [])
+
 def get_todays_games() -> List[Game]:
     """Returns mock data for today's NBA games"""
+    global _TODAY_CACHE
     today = datetime.now().strftime("%B %d, %Y")
-    return [
-        Game(
+    if _TODAY_CACHE[0] == today:
+        return _TODAY_CACHE[1]
+    # Literal values, so skip pydantic validation
+    games = [
+        Game.model_construct(
             id="201",
             awayTeam="Lakers",
             homeTeam="Warriors",
@@ -279,7 +530,7 @@ def get_todays_games() -> List[Game]:
             date=today,
             status="finished"
         ),
-        Game(
+        Game.model_construct(
             id="202",
             awayTeam="Celtics",
             homeTeam="Heat",
@@ -288,7 +539,7 @@ def get_todays_games() -> List[Game]:
             date=today,
             status="scheduled"
         ),
-        Game(
+        Game.model_construct(
             id="203",
             awayTeam="Nuggets",
             homeTeam="Suns",
@@ -297,7 +548,7 @@ def get_todays_games() -> List[Game]:
             date=today,
             status="finished"
         ),
-        Game(
+        Game.model_construct(
             id="204",
             awayTeam="Bucks",
             homeTeam="76ers",
@@ -307,96 +558,129 @@ def get_todays_games() -> List[Game]:
             status="scheduled"
         ),
     ]
+    _TODAY_CACHE = (today, games)
+    return games
 
 # Mock summaries (in production, these would come from LLM generation)
+_NOW = datetime.now().isoformat()
 MOCK_SUMMARIES = {
-    "101": GameSummary(
+    "101": GameSummary.model_construct(
         gameId="101",
         summary="The Warriors secured a 115-108 victory over the Lakers in a closely contested matchup. Stephen Curry led all scorers with 32 points, while LeBron James put up 28 points for the Lakers. The game was tied heading into the fourth quarter, but the Warriors pulled away with clutch three-point shooting down the stretch.",
-        generatedAt=datetime.now().isoformat()
+        generatedAt=_NOW
     ),
-    "102": GameSummary(
+    "102": GameSummary.model_construct(
         gameId="102",
         summary="The Celtics dominated from start to finish, defeating the Heat 122-98. Jayson Tatum scored 35 points and grabbed 12 rebounds, leading Boston to their largest margin of victory this season. Miami struggled with turnovers, committing 18 compared to Boston's 8.",
-        generatedAt=datetime.now().isoformat()
+        generatedAt=_NOW
     ),
-    "103": GameSummary(
+    "103": GameSummary.model_construct(
         gameId="103",
         summary="In a back-and-forth battle, the Nuggets edged out the Suns 119-113. Nikola Jokic recorded a triple-double with 27 points, 14 rebounds, and 11 assists. Devin Booker scored 38 points for Phoenix, but it wasn't enough as Denver's balanced scoring attack proved too much.",
-        generatedAt=datetime.now().isoformat()
+        generatedAt=_NOW
     ),
-    "201": GameSummary(
+    "201": GameSummary.model_construct(
         gameId="201",
         summary="The Warriors defeated the Lakers 115-108 in today's matchup. Key performances from Curry and James highlighted an entertaining game.",
-        generatedAt=datetime.now().isoformat()
+        generatedAt=_NOW
     ),
-    "203": GameSummary(
+    "203": GameSummary.model_construct(
         gameId="203",
         summary="The Nuggets won today's game against the Suns 119-113, with Jokic leading the way.",
-        generatedAt=datetime.now().isoformat()
+        generatedAt=_NOW
     ),
 }
+# Pre-rendered JSON for each mock summary; re-rendered only when its team info changes
+MOCK_SUMMARIES_BYTES: Dict[str, bytes] = {
+    game_id: _SUMMARY_ADAPTER.dump_json(summary) for game_id, summary in MOCK_SUMMARIES.items()
+}
+
+_ROOT_BYTES = orjson.dumps({"message": "NBA Game Recaps API"})
 
 @app.get("/")
 def read_root():
-    return {"message": "NBA Game Recaps API"}
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
+# Last rendered /games/today body: (scoreboard dict it came from, ETag, JSON bytes)
+_TODAY_RESPONSE: Tuple[Optional[Dict[str, Any]], str, bytes] = (None, "", b"")
 
-@app.get("/games/today", response_model=List[Game])
-def get_games_today():
-    """Returns a list of today's NBA games (from cache)."""
+@app.get("/games/today", responses={200: {"model": List[Game]}, 304: {"description": "Not Modified"}})
+async def get_games_today(request: Request):
+    """Returns a list of today's NBA games (from cache). Supports If-None-Match via ETag."""
+    global _TODAY_RESPONSE
     try:
-        scoreboard_data = fetch_scoreboard_data()
-        games = transform_scoreboard_to_games(scoreboard_data)
-        return games
+        scoreboard_data = await fetch_scoreboard_data()
+        source, etag, payload = _TODAY_RESPONSE
+        # Re-render only when the in-memory scoreboard has been reloaded
+        if source is not scoreboard_data:
+            games = transform_scoreboard_to_games(scoreboard_data)
+            queued_ids = _schedule_summary_batch(games)
+            _schedule_boxscore_prewarm(games, skip=queued_ids)
+            payload = orjson.dumps(games)
+            etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+            _TODAY_RESPONSE = (scoreboard_data, etag, payload)
+
+        headers = {"ETag": etag, "Cache-Control": f"max-age={SCOREBOARD_MEM_TTL_SECONDS}"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=payload, media_type="application/json", headers=headers)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching games: {str(e)}")
 
 
-@app.get("/games/today/refresh")
-def refresh_games_today():
+def _read_refreshed_at() -> float:
+    """Reads the last refresh time persisted by a previous run; 0 if there is none."""
+    try:
+        return float(SCOREBOARD_REFRESHED_AT_FILE.read_text().strip())
+    except (ValueError, OSError):
+        return 0.0
+
+
+# Wall-clock time of the last successful refresh; the file only persists it across restarts
+_LAST_REFRESH: float = _read_refreshed_at()
+
+@app.get("/games/today/refresh", responses={200: {"model": List[Game]}, 429: {"description": "Refresh on cooldown"}})
+async def refresh_games_today():
     """Calls NBA scoreboard again and overwrites today's cache. 30-minute cooldown between refreshes."""
     from fastapi.responses import JSONResponse
 
+    global _LAST_REFRESH
     now = time.time()
-    if SCOREBOARD_REFRESHED_AT_FILE.exists():
-        try:
-            last = float(SCOREBOARD_REFRESHED_AT_FILE.read_text().strip())
-            elapsed = now - last
-            if elapsed < REFRESH_COOLDOWN_SECONDS:
-                seconds_left = int(REFRESH_COOLDOWN_SECONDS - elapsed)
-                minutes_left = ceil(seconds_left / 60)
-                return JSONResponse(
-                    status_code=429,
-                    content={
-                        "detail": f"Refresh on cooldown. Try again in {minutes_left} minute(s).",
-                        "retryAfterSeconds": seconds_left,
-                    },
-                    headers={"Retry-After": str(seconds_left)},
-                )
-        except (ValueError, OSError):
-            pass
+    elapsed = now - _LAST_REFRESH
+    if elapsed < REFRESH_COOLDOWN_SECONDS:
+        seconds_left = int(REFRESH_COOLDOWN_SECONDS - elapsed)
+        minutes_left = ceil(seconds_left / 60)
+        return JSONResponse(
+            status_code=429,
+            content={
+                "detail": f"Refresh on cooldown. Try again in {minutes_left} minute(s).",
+                "retryAfterSeconds": seconds_left,
+            },
+            headers={"Retry-After": str(seconds_left)},
+        )
 
-    cache_file = CACHE_DIR / "scoreboard_today.json"
+    # Claim the cooldown before awaiting so overlapping refreshes don't both hit the CDN
+    previous_refresh = _LAST_REFRESH
+    _LAST_REFRESH = now
     try:
-        scoreboard_obj = scoreboard.ScoreBoard()
-        data = scoreboard_obj.get_dict()
-        with open(cache_file, "w") as f:
-            json.dump(data, f, indent=2)
-        SCOREBOARD_REFRESHED_AT_FILE.write_text(str(now))
-        return transform_scoreboard_to_games(data)
+        data = await _fetch_and_cache_scoreboard()
+        await asyncio.to_thread(SCOREBOARD_REFRESHED_AT_FILE.write_text, str(now))
+        return Response(content=orjson.dumps(transform_scoreboard_to_games(data)), media_type="application/json")
     except HTTPException:
+        _LAST_REFRESH = previous_refresh
         raise
     except Exception as e:
+        _LAST_REFRESH = previous_refresh
         raise HTTPException(status_code=500, detail=f"Failed to refresh scoreboard: {str(e)}")
 
 
-@app.get("/games/previous", response_model=List[Game])
+@app.get("/games/previous", responses={200: {"model": List[Game]}})
 def get_games_previous():
     """Returns only games that have a cached summary (summary_*.json). Uses boxscore cache for details."""
     try:
-        return games_with_cached_summaries()
+        return Response(content=orjson.dumps(games_with_cached_summaries()), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading previous games: {str(e)}")
 
@@ -420,7 +704,7 @@ def _extract_team_info(boxscore_data: Dict[str, Any]) -> tuple:
 
 def _cached_to_game_summary(cached: Dict[str, Any]) -> GameSummary:
     """Build GameSummary from cached summary dict."""
-    return GameSummary(
+    return GameSummary.model_construct(
         gameId=cached.get("gameId", ""),
         summary=cached["summary"],
         generatedAt=cached.get("generatedAt", ""),
@@ -431,30 +715,176 @@ def _cached_to_game_summary(cached: Dict[str, Any]) -> GameSummary:
     )
 
 
-@app.get("/games/{game_id}/summary", response_model=GameSummary)
-def get_game_summary(game_id: str):
+SUMMARY_BATCH_SIZE = 15  # games per batched LLM prompt
+_BACKGROUND_TASKS: set = set()  # strong refs so pending tasks aren't garbage collected
+_SUMMARY_IDS_HANDLED: set = set()  # game ids already cached or queued for batch generation
+# game id -> future resolved with the batch's summary (None if it produced none), while queued
+_SUMMARY_PENDING: Dict[str, "asyncio.Future[Optional[GameSummary]]"] = {}
+_PREWARM_PENDING: set = set()  # game ids with a background boxscore fetch in flight
+
+
+def _spawn_background(coro) -> None:
+    """Runs a coroutine as a background task, holding a reference until it finishes."""
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+def _schedule_summary_batch(games: List[GameDict]) -> List[str]:
+    """Queues one batched summary generation for finished games not seen before; the batch itself
+    skips any that already have a cached summary. Returns the queued game ids."""
+    game_ids: List[str] = []
+    if not validate_api_key():
+        return game_ids
+    for game in games:
+        game_id = game["id"]
+        if game["status"] != "finished" or game_id in _SUMMARY_IDS_HANDLED:
+            continue
+        _SUMMARY_IDS_HANDLED.add(game_id)
+        game_ids.append(game_id)
+    if game_ids:
+        loop = asyncio.get_running_loop()
+        for game_id in game_ids:
+            _SUMMARY_PENDING[game_id] = loop.create_future()
+        _spawn_background(_batch_generate_summaries(game_ids))
+    return game_ids
+
+
+def _resolve_pending_summary(game_id: str, summary: Optional[GameSummary]) -> None:
+    """Hands a batch result to on-demand requests waiting on it. A None result lets the id be queued again later."""
+    future = _SUMMARY_PENDING.pop(game_id, None)
+    if future is not None and not future.done():
+        future.set_result(summary)
+    if summary is None:
+        _SUMMARY_IDS_HANDLED.discard(game_id)
+
+
+def _schedule_boxscore_prewarm(games: List[GameDict], skip: List[str]) -> None:
+    """Fetches boxscores for finished games in the background so later summary/previous requests hit the cache.
+    Only finished games are prewarmed because boxscore files are cached forever."""
+    game_ids = [
+        game["id"]
+        for game in games
+        if game["status"] == "finished"
+        and game["id"] not in skip
+        and game["id"] not in _PREWARM_PENDING
+        and _mem_cache_get(CACHE_DIR / f"boxscore_{game['id']}.json", BOXSCORE_MEM_TTL_SECONDS) is None
+    ]
+    if game_ids:
+        _PREWARM_PENDING.update(game_ids)
+        _spawn_background(_prewarm_boxscores(game_ids))
+
+
+async def _prewarm_boxscores(game_ids: List[str]) -> None:
+    """Fetches the given boxscores concurrently; failures are ignored."""
+    try:
+        await asyncio.gather(*(fetch_boxscore_data(game_id) for game_id in game_ids), return_exceptions=True)
+    finally:
+        _PREWARM_PENDING.difference_update(game_ids)
+
+
+async def _batch_generate_summaries(game_ids: List[str]) -> None:
+    """Fetches boxscores concurrently and generates their summaries with one LLM call per batch.
+    Games whose recap is missing from the reply, or whose batch fails, are left for on-demand generation
+    and may be queued again."""
+    try:
+        # Summary files live on disk; read them off the event loop
+        cached = await asyncio.gather(*(asyncio.to_thread(load_cached_summary, game_id) for game_id in game_ids))
+        for game_id, existing in zip(game_ids, cached):
+            if existing:
+                _resolve_pending_summary(game_id, _cached_to_game_summary(existing))
+        uncached_ids = [game_id for game_id in game_ids if game_id in _SUMMARY_PENDING]
+
+        results = await asyncio.gather(*(fetch_boxscore_data(game_id) for game_id in uncached_ids), return_exceptions=True)
+        finished = [
+            (game_id, data)
+            for game_id, data in zip(uncached_ids, results)
+            if isinstance(data, dict) and data.get("game", {}).get("gameStatus") == 3
+        ]
+
+        for start in range(0, len(finished), SUMMARY_BATCH_SIZE):
+            batch = finished[start:start + SUMMARY_BATCH_SIZE]
+            prompt = generate_batch_llm_prompt([data for _, data in batch])
+            try:
+                response_text, prompt_tokens, completion_tokens = await asyncio.to_thread(llm_generate_summary, prompt)
+            except Exception as e:
+                print(f"Error generating batched summaries: {e}")
+                continue
+            recaps = parse_batch_llm_response(response_text, len(batch))
+            generated_at = datetime.utcnow().isoformat() + "Z"
+
+            for index, (game_id, data) in enumerate(batch, start=1):
+                summary_text = recaps.get(index)
+                if not summary_text:
+                    continue
+                # Summaries are cached forever; never overwrite one served in the meantime
+                existing = await asyncio.to_thread(load_cached_summary, game_id)
+                if existing:
+                    _resolve_pending_summary(game_id, _cached_to_game_summary(existing))
+                    continue
+                away_team_id, away_team_name, home_team_id, home_team_name = _extract_team_info(data)
+                await asyncio.to_thread(
+                    save_cached_summary,
+                    game_id=game_id,
+                    summary=summary_text,
+                    generated_at=generated_at,
+                    away_team_id=away_team_id,
+                    home_team_id=home_team_id,
+                    away_team=away_team_name,
+                    home_team=home_team_name,
+                    # Token usage is shared by the whole batch; record each game's share
+                    prompt_tokens=prompt_tokens // len(batch),
+                    completion_tokens=completion_tokens // len(batch),
+                )
+                _resolve_pending_summary(game_id, GameSummary.model_construct(
+                    gameId=game_id,
+                    summary=summary_text,
+                    generatedAt=generated_at,
+                    awayTeamId=away_team_id,
+                    homeTeamId=home_team_id,
+                    awayTeam=away_team_name,
+                    homeTeam=home_team_name,
+                ))
+    finally:
+        # Anything still pending got no summary from this batch
+        for game_id in game_ids:
+            if game_id in _SUMMARY_PENDING:
+                _resolve_pending_summary(game_id, None)
+
+
+@app.get("/games/{game_id}/summary", responses={200: {"model": GameSummary}})
+async def get_game_summary(game_id: str):
     """Returns the LLM-generated summary for a specific game. Cached forever; no regeneration."""
     try:
         # 1. Check file cache first (forever cache)
-        cached = load_cached_summary(game_id)
+        cached = await asyncio.to_thread(load_cached_summary, game_id)
         if cached:
-            return _cached_to_game_summary(cached)
+            return _json_response(_SUMMARY_ADAPTER, _cached_to_game_summary(cached))
+
+        # Queued for background batch generation: wait for it rather than calling the LLM twice
+        pending = _SUMMARY_PENDING.get(game_id)
+        if pending is not None:
+            batched = await asyncio.shield(pending)
+            if batched is not None:
+                return _json_response(_SUMMARY_ADAPTER, batched)
+
+        # Both remaining paths need the boxscore; fetch it exactly once
+        boxscore_data = await fetch_boxscore_data(game_id)
+        away_team_id, away_team_name, home_team_id, home_team_name = _extract_team_info(boxscore_data)
 
         # 2. Legacy mock summaries
         if game_id in MOCK_SUMMARIES:
-            boxscore_data = fetch_boxscore_data(game_id)
-            away_team_id, away_team_name, home_team_id, home_team_name = _extract_team_info(boxscore_data)
             summary = MOCK_SUMMARIES[game_id]
-            summary.awayTeamId = away_team_id
-            summary.homeTeamId = home_team_id
-            summary.awayTeam = away_team_name
-            summary.homeTeam = home_team_name
-            return summary
-
-        # 3. Fetch boxscore and generate via LLM (then cache forever)
-        boxscore_data = fetch_boxscore_data(game_id)
-        away_team_id, away_team_name, home_team_id, home_team_name = _extract_team_info(boxscore_data)
-
+            team_info = (away_team_id, home_team_id, away_team_name, home_team_name)
+            if (summary.awayTeamId, summary.homeTeamId, summary.awayTeam, summary.homeTeam) != team_info:
+                summary.awayTeamId = away_team_id
+                summary.homeTeamId = home_team_id
+                summary.awayTeam = away_team_name
+                summary.homeTeam = home_team_name
+                MOCK_SUMMARIES_BYTES[game_id] = _SUMMARY_ADAPTER.dump_json(summary)
+            return Response(content=MOCK_SUMMARIES_BYTES[game_id], media_type="application/json")
+
+        # 3. Generate via LLM from the boxscore (then cache forever)
         game_data = boxscore_data.get("game", {})
         game_status = game_data.get("gameStatus")
         if game_status != 3:
@@ -470,10 +900,11 @@ def get_game_summary(game_id: str):
             )
 
         prompt = generate_llm_prompt(boxscore_data)
-        summary_text, prompt_tokens, completion_tokens = llm_generate_summary(prompt)
+        summary_text, prompt_tokens, completion_tokens = await asyncio.to_thread(llm_generate_summary, prompt)
         generated_at = datetime.utcnow().isoformat() + "Z"
 
-        save_cached_summary(
+        await asyncio.to_thread(
+            save_cached_summary,
             game_id=game_id,
             summary=summary_text,
             generated_at=generated_at,
@@ -485,7 +916,7 @@ def get_game_summary(game_id: str):
             completion_tokens=completion_tokens,
         )
 
-        return GameSummary(
+        return _json_response(_SUMMARY_ADAPTER, GameSummary.model_construct(
             gameId=game_id,
             summary=summary_text,
             generatedAt=generated_at,
@@ -493,7 +924,7 @@ def get_game_summary(game_id: str):
             homeTeamId=home_team_id,
             awayTeam=away_team_name,
             homeTeam=home_team_name,
-        )
+        ))
     except HTTPException:
         raise
     except ValueError as e:
@@ -3,10 +3,70 @@ Rule-based relevance filter for NBA game statistics.
 Extracts key statistics from game data to create focused LLM prompts.
 """
 
+import re
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, Any, Tuple
 
+# Matches the "[N]" tag that opens each recap in a batched LLM response
+_BATCH_TAG = re.compile(r"^\s*\[(\d+)\]\s*", re.MULTILINE)
+# Closes a batched LLM response; without it the last recap may have been cut off
+_BATCH_END = "[END]"
 
+_PROMPT_TMPL = """Write a professional NBA recap in 3–4 sentences. Use only the facts below; do not speculate or add information not given.
+
+Facts:
+{facts}
+
+Tone: {tone}
+Output: A single paragraph only, no bullet points or headers."""
+
+_BATCH_PROMPT_TMPL = """Write a professional NBA recap in 3–4 sentences for each game below. Use only the facts listed under that game's [index]; do not speculate or add information not given.
+
+{games}
+
+Tone: {tone}
+Output: One paragraph per game, each starting with its [index] tag on the same line, no bullet points or headers. After the last recap, write {end} on its own line."""
+
+# Per-team statistic lines, in prompt order: (statistics key, include?(value, stats), render(team, value, stats)).
+# Missing keys read as 0.
+_TEAM_STAT_SPECS: Tuple[Tuple[str, Callable[[Any, Dict[str, Any]], bool], Callable[[str, Any, Dict[str, Any]], str]], ...] = (
+    # Bench points
+    ("benchPoints",
+     lambda v, s: v > 0,
+     lambda team, v, s: f"{team} bench: {v} points"),
+    # Biggest lead
+    ("biggestLead",
+     lambda v, s: v > 0,
+     lambda team, v, s: f"{team} biggest lead: {v} {'point' if v == 1 else 'points'} ({s.get('biggestLeadScore', '')})"),
+    # Rebounds breakdown
+    ("reboundsOffensive",
+     lambda v, s: True,
+     lambda team, v, s: f"{team} rebounds: {v + s.get('reboundsDefensive', 0)} total ({v} offensive, {s.get('reboundsDefensive', 0)} defensive)"),
+    # Turnovers
+    ("turnoversTotal",
+     lambda v, s: True,
+     lambda team, v, s: f"{team} turnovers: {v}"),
+    # Field goal percentage (if notable - very high or very low)
+    ("fieldGoalsPercentage",
+     lambda v, s: v > 0.5 or v < 0.4,
+     lambda team, v, s: f"{team} field goal percentage: {v:.1%}"),
+    # Three-point percentage (if notable)
+    ("threePointersPercentage",
+     lambda v, s: v > 0.4 or (v < 0.25 and s.get('threePointersMade', 0) > 5),
+     lambda team, v, s: f"{team} three-pointers: {s.get('threePointersMade', 0)} made ({v:.1%})"),
+    # Fast break points (if significant)
+    ("pointsFastBreak",
+     lambda v, s: v >= 15,
+     lambda team, v, s: f"{team} fast break points: {v}"),
+    # Points from turnovers (defensive impact)
+    ("pointsFromTurnovers",
+     lambda v, s: v >= 15,
+     lambda team, v, s: f"{team} points off turnovers: {v}"),
+)
+
+
+@lru_cache(maxsize=1024)
 def determine_time_of_day(game_time_local: str) -> str:
     """
     Determines if game was morning, afternoon, or evening based on local time.
@@ -52,50 +112,11 @@ def extract_team_statistics(team_data: Dict[str, Any], team_type: str) -> List[s
     score = team_data.get('score', 0)
     stats.append(f"{team_name}: {score} points")
     
-    # Bench points
-    bench_points = team_stats.get('benchPoints', 0)
-    if bench_points > 0:
-        stats.append(f"{team_name} bench: {bench_points} points")
-    
-    # Biggest lead
-    biggest_lead = team_stats.get('biggestLead', 0)
-    if biggest_lead > 0:
-        lead_score = team_stats.get('biggestLeadScore', '')
-        point_word = "point" if biggest_lead == 1 else "points"
-        stats.append(f"{team_name} biggest lead: {biggest_lead} {point_word} ({lead_score})")
-    
-    # Rebounds breakdown
-    rebounds_offensive = team_stats.get('reboundsOffensive', 0)
-    rebounds_defensive = team_stats.get('reboundsDefensive', 0)
-    rebounds_total = rebounds_offensive + rebounds_defensive
-    stats.append(f"{team_name} rebounds: {rebounds_total} total ({rebounds_offensive} offensive, {rebounds_defensive} defensive)")
-    
-    # Turnovers
-    turnovers_total = team_stats.get('turnoversTotal', 0)
-    stats.append(f"{team_name} turnovers: {turnovers_total}")
-    
-    # Additional relevant statistics
-    # Field goal percentage (if notable - very high or very low)
-    fg_percentage = team_stats.get('fieldGoalsPercentage', 0)
-    if fg_percentage > 0.5 or fg_percentage < 0.4:
-        stats.append(f"{team_name} field goal percentage: {fg_percentage:.1%}")
-    
-    # Three-point percentage (if notable)
-    three_pt_percentage = team_stats.get('threePointersPercentage', 0)
-    three_pt_made = team_stats.get('threePointersMade', 0)
-    if three_pt_percentage > 0.4 or (three_pt_percentage < 0.25 and three_pt_made > 5):
-        stats.append(f"{team_name} three-pointers: {three_pt_made} made ({three_pt_percentage:.1%})")
-    
-    # Fast break points (if significant)
-    fast_break_points = team_stats.get('pointsFastBreak', 0)
-    if fast_break_points >= 15:
-        stats.append(f"{team_name} fast break points: {fast_break_points}")
+    for key, include, render in _TEAM_STAT_SPECS:
+        value = team_stats.get(key, 0)
+        if include(value, team_stats):
+            stats.append(render(team_name, value, team_stats))
     
-    # Points from turnovers (defensive impact)
-    points_from_turnovers = team_stats.get('pointsFromTurnovers', 0)
-    if points_from_turnovers >= 15:
-        stats.append(f"{team_name} points off turnovers: {points_from_turnovers}")
-
     scoring_leader, highest_points = get_scoring_leader(team_data.get('players', []))
     if scoring_leader:
         stats.append(f"{team_name} scoring leader: {scoring_leader} with {highest_points} points")
@@ -222,17 +243,58 @@ def generate_llm_prompt(game_data: Dict[str, Any], tone: str = "neutral, ESPN-st
     relevant_stats = filter_relevant_statistics(game_data)
     
     # Format statistics as bullet points
-    facts_section = "\n".join([f"- {stat}" for stat in relevant_stats])
+    facts_section = "\n".join("- " + stat for stat in relevant_stats)
     
-    prompt = f"""Write a professional NBA recap in 3–4 sentences. Use only the facts below; do not speculate or add information not given.
+    return _PROMPT_TMPL.format(facts=facts_section, tone=tone)
 
-Facts:
-{facts_section}
 
-Tone: {tone}
-Output: A single paragraph only, no bullet points or headers."""
+def generate_batch_llm_prompt(games_data: List[Dict[str, Any]], tone: str = "neutral, ESPN-style") -> str:
+    """
+    Generates a single LLM prompt covering several games, each tagged with its [index].
     
-    return prompt
+    Args:
+        games_data: List of full game data dictionaries from the JSON
+        tone: Desired tone for the recaps (default: "neutral, ESPN-style")
+    
+    Returns:
+        Formatted prompt string ready for LLM; parse the reply with parse_batch_llm_response
+    """
+    sections = []
+    for index, game_data in enumerate(games_data, start=1):
+        facts_section = "\n".join("- " + stat for stat in filter_relevant_statistics(game_data))
+        sections.append(f"[{index}]\n{facts_section}")
+    
+    return _BATCH_PROMPT_TMPL.format(games="\n\n".join(sections), tone=tone, end=_BATCH_END)
+
+
+def parse_batch_llm_response(response_text: str, count: int) -> Dict[int, str]:
+    """
+    Splits a batched LLM response into per-game recaps.
+    
+    Args:
+        response_text: Raw LLM output for a prompt from generate_batch_llm_prompt
+        count: Number of games that were in the prompt
+    
+    Returns:
+        Dictionary mapping 1-based game index to its recap; missing or empty recaps are omitted,
+        as is the last recap when the response doesn't close with the end marker (likely truncated)
+    """
+    recaps = {}
+    end = response_text.rfind(_BATCH_END)
+    finished = end != -1
+    if finished:
+        response_text = response_text[:end]
+    parts = _BATCH_TAG.split(response_text)
+    # parts is [preamble, index, text, index, text, ...]
+    for i in range(1, len(parts) - 1, 2):
+        if not finished and i == len(parts) - 2:
+            # Nothing follows the last recap, so it can't be trusted to be complete
+            break
+        index = int(parts[i])
+        text = parts[i + 1].strip()
+        if 1 <= index <= count and text and index not in recaps:
+            recaps[index] = text
+    return recaps
 
 
 def generate_llm_prompt_from_file(json_file_path: str, tone: str = "neutral, ESPN-style") -> str:
@@ -246,10 +308,10 @@ def generate_llm_prompt_from_file(json_file_path: str, tone: str = "neutral, ESP
     Returns:
         Formatted prompt string ready for LLM
     """
-    import json
+    from pathlib import Path
+    import orjson
     
-    with open(json_file_path, 'r') as f:
-        game_data = json.load(f)
+    game_data = orjson.loads(Path(json_file_path).read_bytes())
     
     return generate_llm_prompt(game_data, tone)
 